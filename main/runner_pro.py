@@ -1,5 +1,7 @@
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 
 
 def main():
@@ -21,6 +23,9 @@ def main():
         "TripInformation",
     ]
 
+    # TDCS timestamps, e.g. "2023-12-04 08:34:50"
+    datetime_format = "%Y-%m-%d %H:%M:%S"
+
     # tasks: (column name, col_type)
     tasks = [
         ("VehicleType", None),
@@ -39,33 +44,43 @@ def main():
     n_jobs = max(1, (os.cpu_count() or 2) - 1)
     copy_input = False
 
-    for idx, (col_name, col_type) in enumerate(tasks, start=1):
-        print(f"\n=== Task {idx}/{len(tasks)}: col_name={col_name}, col_type={col_type} ===")
-        result_dir = os.path.join(project_root, "result", f"{col_name}_r{ratmin}-{ratmax}_n{nrat}")
-        try:
-            runner = BenchmarkRunner(
-                csv_path=csv_path,
-                col_name=col_name,
-                col_type=col_type,
-                algos=None,
-                ratios=None,
-                ratmin=ratmin,
-                ratmax=ratmax,
-                nrat=nrat,
-                repeat=repeat,
-                sequential=sequential,
-                prefix_random=prefix_random,
-                save_csv=os.path.join(result_dir, "timing.csv"),
-                save_json=os.path.join(result_dir, "report.json"),
-                save_plot=os.path.join(result_dir, "plot.png"),
-                expected_cols=DEFAULT_COLUMNS,
-                n_jobs=n_jobs,
-                copy_input=copy_input,
-            )
-            _ = runner.run()
-            print(f"Task {idx}: completed. Outputs in: {result_dir}")
-        except Exception as e:
-            print(f"Task {idx}: FAILED with error: {e}")
+    # read the CSV once and share the frame across all column tasks
+    cached_df = BenchmarkRunner.load_data(csv_path, DEFAULT_COLUMNS, io_engine="auto", cache_parquet=True)
+
+    # one worker pool for every task: workers start (and import the kernels) only once
+    pool = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else nullcontext()
+    with pool as executor:
+        for idx, (col_name, col_type) in enumerate(tasks, start=1):
+            print(f"\n=== Task {idx}/{len(tasks)}: col_name={col_name}, col_type={col_type} ===")
+            result_dir = os.path.join(project_root, "result", f"{col_name}_r{ratmin}-{ratmax}_n{nrat}")
+            try:
+                runner = BenchmarkRunner(
+                    csv_path=csv_path,
+                    col_name=col_name,
+                    col_type=col_type,
+                    datetime_format=datetime_format,
+                    algos=None,
+                    ratios=None,
+                    ratmin=ratmin,
+                    ratmax=ratmax,
+                    nrat=nrat,
+                    repeat=repeat,
+                    sequential=sequential,
+                    prefix_random=prefix_random,
+                    save_csv=os.path.join(result_dir, "timing.csv"),
+                    save_json=os.path.join(result_dir, "report.json"),
+                    save_plot=os.path.join(result_dir, "plot.png"),
+                    expected_cols=DEFAULT_COLUMNS,
+                    n_jobs=n_jobs,
+                    executor=executor,
+                    copy_input=copy_input,
+                    df=cached_df,
+                    cache_parquet=True,
+                )
+                _ = runner.run()
+                print(f"Task {idx}: completed. Outputs in: {result_dir}")
+            except Exception as e:
+                print(f"Task {idx}: FAILED with error: {e}")
 
     print("\nAll tasks completed (some may have failed; see logs above).")
 
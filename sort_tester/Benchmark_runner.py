@@ -1,12 +1,22 @@
 import os
 import json
-from typing import List, Optional, Dict
+import hashlib
+from concurrent.futures import Executor
+from typing import List, Optional, Dict, Literal
 
 import numpy as np
 import pandas as pd
-from sort_tester.core import SortTester
+from sort_tester.core import SortTester, BACKENDS
 from sort_tester.algorithms import builtin_algorithms
 from sort_tester.plotting import plot_times_df
+from sort_tester.utils import pack_code, code_fits
+
+IO_ENGINES = ("auto", "pandas", "polars", "pyarrow")
+# strings pd.read_csv reads as missing by default
+_PANDAS_NA_VALUES = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+                     "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+CODE_PATTERN = r'^\s*(?P<p1>\d+)(?P<p2>[A-Za-z])(?P<p3>\d+)(?P<p4>[A-Za-z])\s*$'
+_LETTERS = [chr(c) for c in range(ord('A'), ord('Z') + 1)]
 
 
 class BenchmarkRunner:
@@ -17,6 +27,7 @@ class BenchmarkRunner:
         col_type: Optional[str] = None,
         category_order: Optional[List[str]] = None,
         code_suffix_order: Optional[List[str]] = None,
+        datetime_format: Optional[str] = None,
         algos: Optional[str] = None,
         ratios: Optional[str] = None,
         ratmin: float = 0.01,
@@ -31,13 +42,20 @@ class BenchmarkRunner:
         random_seed: int = 42,
         expected_cols: Optional[list] = None,
         n_jobs: int = 1,
-        copy_input: bool = False
+        copy_input: bool = False,
+        df: Optional[pd.DataFrame] = None,
+        io_engine: Literal["auto", "pandas", "polars", "pyarrow"] = "auto",
+        cache_parquet: bool = False,
+        verbose: bool = False,
+        executor: Optional[Executor] = None,
+        backend: Literal["auto", "thread", "process"] = "auto"
     ):
         self.csv_path = csv_path
         self.col_name = col_name
         self.col_type = (col_type or "").strip().lower() or None
         self.category_order = category_order
         self.code_suffix_order = code_suffix_order
+        self.datetime_format = datetime_format
         # preserve inputs for title/folder info
         self._ratmin_input = ratmin
         self._ratmax_input = ratmax
@@ -51,26 +69,81 @@ class BenchmarkRunner:
         self.save_plot = save_plot
         self.random_seed = random_seed
         self.expected_cols = expected_cols
-        self.data = self._load_and_prepare(csv_path)
+        if io_engine not in IO_ENGINES:
+            raise ValueError(f"io_engine must be one of {IO_ENGINES}, got '{io_engine}'")
+        self.io_engine = io_engine
+        self.cache_parquet = bool(cache_parquet)
+        self.verbose = bool(verbose)
+        # a pre-loaded frame (e.g. shared across several column tasks) skips the CSV read
+        self.data = df if df is not None else self._load_and_prepare(csv_path)
         self.algos_arg = algos
         self.n_jobs = int(n_jobs)
+        # an externally owned pool, shared across runners to pay worker start-up once
+        self.executor = executor
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got '{backend}'")
+        self.backend = backend
         self.copy_input = bool(copy_input)
 
     def _load_and_prepare(self, path: str) -> pd.DataFrame:
-        if not os.path.isabs(path):
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.abspath(os.path.join(script_dir, ".."))
-            path = os.path.join(project_root, path)
-            path = os.path.normpath(path)
+        return self.load_data(path, self.expected_cols, io_engine=self.io_engine, cache_parquet=self.cache_parquet)
+
+    @staticmethod
+    def _read_csv(path: str, io_engine: str = "auto") -> pd.DataFrame:
+        # polars / pyarrow tokenize on all cores; pandas' C parser is single-threaded.
+        # Under "auto", a file the faster engine cannot parse falls through to the next one.
+        if io_engine in ("auto", "polars"):
+            try:
+                import polars as pl  # type: ignore
+                # infer dtypes from every row and treat pandas' NA markers as nulls, so a
+                # late float or "NA" in an integer column parses as pandas would
+                return pl.read_csv(path, infer_schema_length=None, null_values=_PANDAS_NA_VALUES).to_pandas()
+            except ImportError:
+                if io_engine == "polars":
+                    raise
+            except Exception as e:
+                if io_engine == "polars":
+                    raise
+                print(f"Warning: polars could not parse {path} ({type(e).__name__}); trying the next engine.")
+        if io_engine in ("auto", "pyarrow"):
+            try:
+                import pyarrow  # type: ignore  # noqa: F401
+                return pd.read_csv(path, engine="pyarrow")
+            except ImportError:
+                if io_engine == "pyarrow":
+                    raise
+            except ValueError as e:
+                if io_engine == "pyarrow":
+                    raise
+                print(f"Warning: pyarrow could not parse {path} ({type(e).__name__}); falling back to pandas.")
+        return pd.read_csv(path)
+
+    @staticmethod
+    def load_data(
+        path: str,
+        expected_cols: Optional[list] = None,
+        io_engine: str = "auto",
+        cache_parquet: bool = False
+    ) -> pd.DataFrame:
+        path = BenchmarkRunner._resolve_path(path)
         if not os.path.exists(path):
             raise FileNotFoundError(f"File not found: {path}")
 
-        df = pd.read_csv(path)
-        if self.expected_cols:
-            if len(df.columns) == len(self.expected_cols):
-                df.columns = self.expected_cols
+        parquet_path = path + ".parquet"
+        if cache_parquet and os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+            df = pd.read_parquet(parquet_path)
+        else:
+            df = BenchmarkRunner._read_csv(path, io_engine)
+            if cache_parquet:
+                try:
+                    df.to_parquet(parquet_path)
+                except (ImportError, ValueError, OSError) as e:
+                    print(f"Warning: could not write Parquet cache {parquet_path}: {e}")
+        if expected_cols:
+            if len(df.columns) == len(expected_cols):
+                df.columns = expected_cols
             else:
-                print(f"Warning: CSV has {len(df.columns)} columns, expected {len(self.expected_cols)}; keeping original names.")
+                print(f"Warning: CSV has {len(df.columns)} columns, expected {len(expected_cols)}; keeping original names.")
         return df
 
     @staticmethod
@@ -99,9 +172,16 @@ class BenchmarkRunner:
                 chosen[n] = builtin_algorithms[n]
 
         # 如果列是浮点数，则剔除 radix_sort
-        if not pd.api.types.is_integer_dtype(col_series) and 'radix_sort' in chosen:
-            print("Note: Column is not integer, skipping radix_sort")
-            chosen.pop('radix_sort')
+        if not pd.api.types.is_integer_dtype(col_series):
+            for name in [n for n in chosen if n.startswith('radix_sort')]:
+                print(f"Note: Column is not integer, skipping {name}")
+                chosen.pop(name)
+
+        # numba kernels only compile for numeric arrays
+        if not pd.api.types.is_numeric_dtype(col_series):
+            for name in [n for n in chosen if n.endswith('_numba')]:
+                print(f"Note: Column is not numeric, skipping {name}")
+                chosen.pop(name)
 
         return chosen
 
@@ -113,21 +193,141 @@ class BenchmarkRunner:
         if d and not os.path.exists(d):
             os.makedirs(d, exist_ok=True)
 
-    def run(self) -> Dict:
-        if self.col_name not in self.data.columns:
-            raise ValueError(f"Column '{self.col_name}' not found in CSV. Available columns: {self.data.columns.tolist()}")
+    @staticmethod
+    def _resolve_path(path: str) -> str:
+        if not os.path.isabs(path):
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.abspath(os.path.join(script_dir, ".."))
+            path = os.path.join(project_root, path)
+            path = os.path.normpath(path)
+        return path
 
+    def _column_cache_path(self) -> Optional[str]:
+        path = self._resolve_path(self.csv_path)
+        if not os.path.exists(path):
+            return None
+        # the CSV mtime is part of the key, so editing the CSV invalidates the cache
+        key = repr((
+            os.path.getmtime(path), self.expected_cols, self.col_name, self.col_type, self.category_order,
+            self.code_suffix_order, self.datetime_format
+        ))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return f"{path}.{self.col_name}.{self.col_type or 'raw'}.{digest}.parquet"
+
+    @staticmethod
+    def _extract_code_fields(series_raw: pd.Series, suffix_map: Dict[str, int]):
+        """
+        Split code strings into (matched, p1, p2, p3, p4): a row mask plus the numeric
+        fields of the matched rows. Fixed-width codes are sliced bytewise; anything else
+        uses pyarrow's RE2 kernels when available (DFA, no backtracking, no per-row
+        Python calls), else pandas' str.extract.
+        """
+        fixed = BenchmarkRunner._extract_fixed_width_codes(series_raw, suffix_map)
+        if fixed is not None:
+            return fixed
+        return BenchmarkRunner._extract_regex_codes(series_raw, suffix_map)
+
+    @staticmethod
+    def _extract_fixed_width_codes(series_raw: pd.Series, suffix_map: Dict[str, int]):
+        """
+        Fast path for the 8-char gantry layout "DDLDDDDL" (e.g. "03F0158N"): view the
+        column as S9 bytes and read fields by position, no regex. Rows off that layout
+        go through the regex path. Returns None when the column cannot be byte-viewed.
+        """
+        try:
+            # S9 instead of S8 so over-long values show up as a non-NUL ninth byte
+            raw = series_raw.to_numpy(dtype="S9")
+        except (TypeError, ValueError, UnicodeError):
+            return None
+        if len(raw) == 0:
+            return None
+        b = raw.view(np.uint8).reshape(-1, 9)
+        # uint8 arithmetic wraps, so one `< 10` / `< 26` test also rejects bytes below '0' / 'A'
+        digits = b[:, [0, 1, 3, 4, 5, 6]] - np.uint8(ord('0'))
+        letters = (b[:, [2, 7]] & np.uint8(0xDF)) - np.uint8(ord('A'))
+        valid = (digits < 10).all(axis=1) & (letters < 26).all(axis=1) & (b[:, 8] == 0)
+        if not valid.any():
+            return None
+
+        suffix_table = np.array([suffix_map[ch] for ch in _LETTERS], dtype=np.int64)
+        digits = digits.astype(np.int64)
+        p1 = (digits[:, 0] * 10 + digits[:, 1]).astype(np.float64)
+        p3 = (digits[:, 2] * 1000 + digits[:, 3] * 100 + digits[:, 4] * 10 + digits[:, 5]).astype(np.float64)
+        p2 = letters[:, 0].astype(np.int64)
+        # invalid rows hold garbage letters; clip so the lookup stays in bounds
+        p4 = suffix_table[np.minimum(letters[:, 1], 25)]
+        matched = valid.copy()
+        bad = np.flatnonzero(~valid)
+        if bad.size:
+            # padded or differently sized codes still get the full pattern
+            sub_matched, s1, s2, s3, s4 = BenchmarkRunner._extract_regex_codes(series_raw.iloc[bad], suffix_map)
+            hit = bad[sub_matched]
+            matched[hit] = True
+            p1[hit], p2[hit], p3[hit], p4[hit] = s1, s2, s3, s4
+        return matched, p1[matched], p2[matched], p3[matched], p4[matched]
+
+    @staticmethod
+    def _extract_regex_codes(series_raw: pd.Series, suffix_map: Dict[str, int]):
+        suffix_table = np.array([suffix_map[ch] for ch in _LETTERS], dtype=np.int64)
+        try:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.compute as pc  # type: ignore
+        except ImportError:
+            pa = None
+        if pa is not None:
+            parts = pc.extract_regex(pa.array(series_raw.astype("string")), pattern=CODE_PATTERN)
+            matched = parts.is_valid().to_numpy(zero_copy_only=False)
+            parts = parts.filter(parts.is_valid())
+            letters = pa.array(_LETTERS)
+            # float64 keeps over-long digit runs castable; code_fits rejects them later
+            p1 = pc.cast(parts.field("p1"), pa.float64()).to_numpy()
+            p2 = pc.index_in(pc.utf8_upper(parts.field("p2")), value_set=letters).to_numpy(zero_copy_only=False)
+            p3 = pc.cast(parts.field("p3"), pa.float64()).to_numpy()
+            p4_idx = pc.index_in(pc.utf8_upper(parts.field("p4")), value_set=letters).to_numpy(zero_copy_only=False)
+            return matched, p1, p2, p3, suffix_table[p4_idx]
+
+        # letter groups are mapped through full A-Z lookup tables instead of a per-row callback
+        letter_rank = {ch: i for i, ch in enumerate(_LETTERS)}
+        parts = series_raw.astype("string").str.extract(CODE_PATTERN)
+        matched = parts["p1"].notna().to_numpy()
+        parts = parts.loc[matched]
+        p1 = parts["p1"].astype("float64").to_numpy()
+        p2 = parts["p2"].str.upper().map(letter_rank).to_numpy()
+        p3 = parts["p3"].astype("float64").to_numpy()
+        p4 = parts["p4"].str.upper().map(suffix_map).to_numpy()
+        return matched, p1, p2, p3, p4
+
+    def _parse_datetime_ns(self, series_raw: pd.Series) -> np.ndarray:
+        """Parse a time column into int64 ns values, dropping unparsable rows."""
+        dtype = series_raw.dtype
+        arrow_backed = (
+            (isinstance(dtype, pd.ArrowDtype) and dtype.kind in "OU")
+            or (isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow")
+        )
+        if arrow_backed and self.datetime_format:
+            # pyarrow-backed strings are parsed in C++ straight from the Arrow buffers;
+            # for object columns the pandas path below is as fast once conversion is counted
+            import pyarrow as pa  # type: ignore
+            import pyarrow.compute as pc  # type: ignore
+            ts = pc.strptime(pa.array(series_raw), format=self.datetime_format, unit="ns", error_is_null=True)
+            ts = ts.filter(ts.is_valid())
+            return pc.cast(ts, pa.int64()).to_numpy()
+        # an explicit format (e.g. "%Y-%m-%d %H:%M:%S") parses in one vectorized pass
+        dt = pd.to_datetime(series_raw, format=self.datetime_format, errors="coerce", cache=True)
+        # the pyarrow reader may already infer datetime64[s]; normalize to ns
+        dt = dt.dt.as_unit("ns")
+        return dt[dt.notna()].astype("int64").to_numpy()
+
+    def _preprocess(self) -> pd.DataFrame:
         series_raw = self.data[self.col_name]
-        # Manual typed preprocessing
+        # Manual typed preprocessing. Only the benchmarked column is carried into
+        # `cleaned`: SortTester never reads the other columns, so copying them is waste.
         if self.col_type in {"time", "datetime", "timestamp", "date"}:
-            dt = pd.to_datetime(series_raw, errors="coerce")
-            mask = dt.notna()
-            if mask.sum() == 0:
+            values = self._parse_datetime_ns(series_raw)
+            if values.size == 0:
                 raise ValueError(f"Column '{self.col_name}' set as {self.col_type} but cannot be parsed as datetime.")
-            series = dt[mask].view("int64")
-            cleaned = self.data.loc[mask].copy()
-            cleaned[self.col_name] = series.values
-            print(f"Column '{self.col_name}' parsed as datetime -> int64 ns ({mask.sum()} rows).")
+            cleaned = pd.DataFrame({self.col_name: values})
+            print(f"Column '{self.col_name}' parsed as datetime -> int64 ns ({values.size} rows).")
         elif self.col_type in {"category", "categorical"}:
             ser = series_raw.astype("string")
             if self.category_order:
@@ -138,60 +338,74 @@ class BenchmarkRunner:
             mask = codes >= 0
             if mask.sum() == 0:
                 raise ValueError(f"Column '{self.col_name}' set as category but no valid categories found.")
-            cleaned = self.data.loc[mask].copy()
-            cleaned[self.col_name] = codes.loc[mask].values
-            series = cleaned[self.col_name]
+            cleaned = pd.DataFrame({self.col_name: codes.loc[mask].values})
             print(f"Column '{self.col_name}' parsed as categorical codes ({mask.sum()} rows).")
         elif self.col_type in {"code", "gantry", "alphanum"}:
-            import re
-            pattern = re.compile(r'^\s*(\d+)([A-Za-z])(\d+)([A-Za-z])\s*$')
             suffix_rank = {}
             if self.code_suffix_order:
                 for i, k in enumerate(self.code_suffix_order):
                     suffix_rank[str(k).upper()] = i
             else:
                 suffix_rank = {"N": 0, "S": 1}
-            def encode_one(x):
-                if not isinstance(x, str):
-                    try:
-                        x = str(x)
-                    except Exception:
-                        return None
-                m = pattern.match(x)
-                if not m:
-                    return None
-                g1, g2, g3, g4 = m.groups()
-                try:
-                    p1 = int(g1)
-                    p2 = ord(g2.upper()) - ord('A')
-                    p3 = int(g3)
-                    p4 = suffix_rank.get(g4.upper(), ord(g4.upper()) - ord('A') + 100)
-                    return (p1, p2, p3, p4)
-                except Exception:
-                    return None
-            tuples = series_raw.map(encode_one)
-            mask = tuples.notna()
+            suffix_map = {ch: suffix_rank.get(ch, ord(ch) - ord('A') + 100) for ch in _LETTERS}
+            matched, p1, p2, p3, p4 = self._extract_code_fields(series_raw, suffix_map)
+            # codes whose fields overflow the packed layout are dropped like non-matching rows
+            fits = code_fits(p1, p2, p3, p4)
+            mask = matched.copy()
+            mask[matched] = fits
             if mask.sum() == 0:
                 raise ValueError(f"Column '{self.col_name}' set as code but values do not match expected pattern.")
-            cleaned = self.data.loc[mask].copy()
-            cleaned[self.col_name] = tuples.loc[mask].tolist()
-            series = cleaned[self.col_name]
-            print(f"Column '{self.col_name}' parsed as code tuples ({mask.sum()} rows).")
+            # one uint64 per row (see utils.CODE_FIELD_BITS / unpack_code) so the
+            # sorters compare native integers instead of Python tuples
+            packed = pack_code(p1[fits], p2[fits], p3[fits], p4[fits])
+            cleaned = pd.DataFrame({self.col_name: packed})
+            print(f"Column '{self.col_name}' parsed as packed uint64 codes ({mask.sum()} rows).")
         else:
             series = series_raw.dropna()
             if not pd.api.types.is_numeric_dtype(series):
                 series = pd.to_numeric(series, errors="coerce").dropna()
-            cleaned = self.data.loc[series.index].copy()
-            cleaned[self.col_name] = series.values
+            if pd.api.types.is_integer_dtype(series) and len(series) > 0:
+                # narrowest integer dtype holding the value range: fewer bytes moved per
+                # compare/swap (floats are left alone to avoid losing precision)
+                lo, hi = int(series.min()), int(series.max())
+                if lo >= 0:
+                    narrow = np.min_scalar_type(hi)
+                else:
+                    # -hi - 1 forces a signed type wide enough for hi
+                    narrow = np.result_type(np.min_scalar_type(lo), np.min_scalar_type(-hi - 1))
+                series = series.astype(narrow)
+            cleaned = pd.DataFrame({self.col_name: series.values})
+        return cleaned
+
+    def run(self) -> Dict:
+        if self.col_name not in self.data.columns:
+            raise ValueError(f"Column '{self.col_name}' not found in CSV. Available columns: {self.data.columns.tolist()}")
+
+        cache_path = self._column_cache_path() if self.cache_parquet else None
+        if cache_path and os.path.exists(cache_path):
+            cleaned = pd.read_parquet(cache_path)
+            print(f"Column '{self.col_name}' loaded from preprocessed cache {cache_path} ({len(cleaned)} rows).")
+        else:
+            cleaned = self._preprocess()
+            if cache_path:
+                try:
+                    cleaned.to_parquet(cache_path)
+                except (ImportError, ValueError, OSError) as e:
+                    print(f"Warning: could not write preprocessed cache {cache_path}: {e}")
+        series = cleaned[self.col_name]
 
         self.algos = self._choose_algorithms(self.algos_arg, series)
 
-        print(f"Running benchmark on column '{self.col_name}' with {len(cleaned)} rows, {cleaned[self.col_name].nunique()} unique values")
+        # the distinct-value count is a full hash pass over N rows; it is only computed
+        # after timing, and only when it will be reported
+        print(f"Running benchmark on column '{self.col_name}' with {len(cleaned)} rows")
         print(f"Algorithms: {list(self.algos.keys())}")
         print(f"Ratios: {self.ratios}")
         print(f"Repeat: {self.repeat}, Sequential sampling: {self.sequential}")
 
-        tester = SortTester(cleaned, self.col_name, random_seed=self.random_seed, copy_input=self.copy_input)
+        # hand the bare key array to the tester; it only needs this one column
+        tester = SortTester(cleaned[self.col_name].to_numpy(), self.col_name, random_seed=self.random_seed, copy_input=self.copy_input)
+        tester.precompute_samples(self.ratios, sequential=self.sequential, prefix_random=self.prefix_random)
         ratios_dict = {name: self.ratios for name in self.algos.keys()}
 
         times_df = tester.run_algorithms(
@@ -202,7 +416,9 @@ class BenchmarkRunner:
             prefix_random=self.prefix_random,
             check_sorted=True,
             show_progress=True,
-            n_jobs=self.n_jobs
+            n_jobs=self.n_jobs,
+            executor=self.executor,
+            backend=self.backend
         )
         times_df.index.name = "ratio"
 
@@ -218,10 +434,15 @@ class BenchmarkRunner:
             times_df.to_csv(self.save_csv)
             print(f"Saved timing table to: {self.save_csv}")
 
+        n_unique = None
+        if self.verbose or self.save_json:
+            n_unique = int(pd.unique(tester.base_array).size)
+            print(f"Column '{self.col_name}': {n_unique} unique values")
+
         if self.save_json:
             self._ensure_output_dir(self.save_json)
             with open(self.save_json, "w", encoding="utf-8") as fh:
-                json.dump({"timings": times_df.to_dict(), "complexities": complexities}, fh, indent=2)
+                json.dump({"timings": times_df.to_dict(), "complexities": complexities, "n_unique": n_unique}, fh, indent=2)
             print(f"Saved JSON report to: {self.save_json}")
 
         # build title suffix with ratio info when available
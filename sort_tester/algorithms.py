@@ -1,23 +1,55 @@
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Union
 from .utils import ensure_list
+import numpy as np
 import random
+from collections import Counter
+from itertools import chain, repeat
 
-Algorithm = Callable[[List], List]
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the *_numba variants are only registered when present
+    njit = None
+
+ArrayLike = Union[np.ndarray, List]
+Algorithm = Callable[[np.ndarray], np.ndarray]
 builtin_algorithms: Dict[str, Algorithm] = {}
 
-def register(name: str):
+def register(name: str, accepts_ndarray: bool = True, pure: bool = False, needs_unique: bool = False,
+             nogil: bool = False):
+    # accepts_ndarray=False: the benchmark hands the algorithm a Python list instead
+    # pure=True: the input is never modified, so the benchmark skips the per-run copy
+    # needs_unique=True: the benchmark also passes the sorted distinct values as `unique_list`
+    # nogil=True: the sort runs without holding the GIL, so it can be timed on a thread
     def _decorator(fn: Algorithm):
+        fn.accepts_ndarray = accepts_ndarray
+        fn.mutates_input = not pure
+        fn.needs_unique = needs_unique
+        fn.nogil = nogil
         builtin_algorithms[name] = fn
         return fn
     return _decorator
 
-# @register('python_sorted')
-# def python_sorted(arr: List, **kw):
-#     return sorted(arr)
+def _to_list(arr: ArrayLike) -> List:
+    # ndarray.tolist() yields native Python scalars, which the interpreter-level
+    # loops compare much faster than boxed NumPy scalars
+    if isinstance(arr, np.ndarray):
+        return arr.tolist()
+    return list(arr)
 
-@register('insertion_sort')
-def insertion_sort(arr: List, **kw):
-    a = list(arr)
+def _like_input(a: List, arr: ArrayLike) -> ArrayLike:
+    if not isinstance(arr, np.ndarray):
+        return a
+    # fromiter keeps tuple elements of object columns intact (np.asarray would not)
+    return np.fromiter(a, dtype=arr.dtype, count=len(a))
+
+# Timsort on boxed Python objects: the interpreter-level reference line
+@register('python_sorted', accepts_ndarray=False, pure=True)
+def python_sorted(arr: List, **kw):
+    return sorted(arr)
+
+@register('insertion_sort', pure=True)
+def insertion_sort(arr: ArrayLike, **kw):
+    a = _to_list(arr)
     for i in range(1, len(a)):
         key = a[i]
         j = i - 1
@@ -25,36 +57,60 @@ def insertion_sort(arr: List, **kw):
             a[j + 1] = a[j]
             j -= 1
         a[j + 1] = key
-    return a
+    return _like_input(a, arr)
 
-@register('merge_sort')
-def merge_sort(arr: List, **kw):
-    if len(arr) <= 1:
-        return list(arr)
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
-    i = j = 0
-    out = []
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            out.append(left[i]); i += 1
-        else:
-            out.append(right[j]); j += 1
-    out.extend(left[i:]); out.extend(right[j:])
-    return out
+@register('merge_sort', pure=True)
+def merge_sort(arr: ArrayLike, **kw):
+    # bottom-up: merge runs of width 1, 2, 4, ... ping-ponging between two
+    # preallocated buffers instead of recursing and allocating per call
+    a = _to_list(arr)
+    n = len(a)
+    tgt = list(a)
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if a[i] <= a[j]:
+                    tgt[k] = a[i]; i += 1
+                else:
+                    tgt[k] = a[j]; j += 1
+                k += 1
+            tgt[k:k + mid - i] = a[i:mid]
+            k += mid - i
+            tgt[k:hi] = a[j:hi]
+        a, tgt = tgt, a
+        width *= 2
+    return _like_input(a, arr)
+
+# ranges at or below this size are finished by insertion sort (introsort-style cutoff)
+_SMALL_RANGE = 16
 
-@register('quick_sort_2')
-def quick_sort_2(arr: List, **kw):
-    nums = list(arr)
+def _insertion_sort_range(nums: List, left: int, right: int):
+    for i in range(left + 1, right + 1):
+        key = nums[i]
+        j = i - 1
+        while j >= left and nums[j] > key:
+            nums[j + 1] = nums[j]
+            j -= 1
+        nums[j + 1] = key
+
+@register('quick_sort_2', pure=True)
+def quick_sort_2(arr: ArrayLike, **kw):
+    nums = _to_list(arr)
     n = len(nums)
     if n <= 1:
-        return nums
+        return _like_input(nums, arr)
     stack = [(0, n - 1)]
     while stack:
         left, right = stack.pop()
         if left >= right:
             continue
+        if right - left < _SMALL_RANGE:
+            _insertion_sort_range(nums, left, right)
+            continue
         pivot_index = random.randint(left, right)
         nums[pivot_index], nums[right] = nums[right], nums[pivot_index]
         pivot = nums[right]
@@ -69,20 +125,23 @@ def quick_sort_2(arr: List, **kw):
             stack.append((left, mid - 1))
         if mid + 1 < right:
             stack.append((mid + 1, right))
-    return nums
+    return _like_input(nums, arr)
 
 
-@register('quick_sort_3')
-def quick_sort_3(arr: List, **kw):
-    nums = list(arr)
+@register('quick_sort_3', pure=True)
+def quick_sort_3(arr: ArrayLike, **kw):
+    nums = _to_list(arr)
     n = len(nums)
     if n <= 1:
-        return nums
+        return _like_input(nums, arr)
     stack = [(0, n - 1)]
     while stack:
         left, right = stack.pop()
         if left >= right:
             continue
+        if right - left < _SMALL_RANGE:
+            _insertion_sort_range(nums, left, right)
+            continue
         pivot_index = random.randint(left, right)
         nums[left], nums[pivot_index] = nums[pivot_index], nums[left]
         pivot = nums[left]
@@ -101,7 +160,7 @@ def quick_sort_3(arr: List, **kw):
             stack.append((left, lt - 1))
         if gt + 1 < right:
             stack.append((gt + 1, right))
-    return nums
+    return _like_input(nums, arr)
 
 
 # @register('quick_sort_3_p')
@@ -114,9 +173,9 @@ def quick_sort_3(arr: List, **kw):
 #     right = [x for x in arr if x > pivot]
 #     return quick_sort_3(left) + mid + quick_sort_3(right)
 
-@register('comb_sort')
-def comb_sort(arr: List, **kw):
-    a = list(arr)
+@register('comb_sort', pure=True)
+def comb_sort(arr: ArrayLike, **kw):
+    a = _to_list(arr)
     n = len(a)
     gap = n
     shrink = 1.3
@@ -132,34 +191,58 @@ def comb_sort(arr: List, **kw):
                 a[i], a[i + gap] = a[i + gap], a[i]
                 sorted_flag = False
             i += 1
-    return a
+    return _like_input(a, arr)
+
+def _to_radix_keys(a: np.ndarray) -> np.ndarray:
+    # reinterpret integers as same-width unsigned keys; flipping the sign bit of
+    # signed values makes unsigned byte order match numeric order
+    if a.dtype.kind not in 'iub':
+        raise TypeError(f"radix sort needs integer or bool keys, got dtype {a.dtype}")
+    udt = np.dtype(f'u{a.dtype.itemsize}')
+    if a.dtype.kind == 'i':
+        return a.view(udt) ^ udt.type(1 << (8 * a.dtype.itemsize - 1))
+    return a.astype(udt, copy=True)
+
+def _from_radix_keys(keys: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    if dtype.kind == 'i':
+        keys = keys ^ keys.dtype.type(1 << (8 * dtype.itemsize - 1))
+    return keys.view(dtype)
 
-@register('radix_sort')
-def radix_sort(arr: List, **kw):
+@register('radix_sort', pure=True)
+def radix_sort(arr: ArrayLike, **kw):
+    # LSD radix sort on 8-bit digits: itemsize passes, 256 buckets per pass
+    if isinstance(arr, np.ndarray):
+        keys = _to_radix_keys(arr)
+        n = keys.size
+        # bytes above the maximum key's highest set bit are zero for every key
+        n_bits = int(keys.max()).bit_length() if n else 0
+        for shift in range(0, n_bits, 8):
+            digit = ((keys >> keys.dtype.type(shift)) & keys.dtype.type(0xFF)).astype(np.uint8)
+            count = np.bincount(digit, minlength=256)
+            if count.max() == n:
+                # every key shares this byte: the pass would be the identity permutation
+                continue
+            # a stable argsort on uint8 digits is NumPy's own counting scatter
+            keys = keys[np.argsort(digit, kind='stable')]
+        return _from_radix_keys(keys, arr.dtype)
     a = list(arr)
     if not a:
         return a
-    max_val = max(a)
-    exp = 1
-    while max_val // exp > 0:
-        output = [0]*len(a)
-        count = [0]*10
-        for i in a:
-            index = (i // exp) % 10
-            count[index] += 1
-        for i in range(1, 10):
-            count[i] += count[i-1]
-        for i in reversed(a):
-            index = (i // exp) % 10
-            output[count[index]-1] = i
-            count[index] -= 1
-        a = list(output)
-        exp *= 10
+    # Python ints are unbounded: offset by the minimum so keys are non-negative
+    lo = min(a)
+    max_key = max(a) - lo
+    shift = 0
+    while (max_key >> shift) > 0:
+        buckets = [[] for _ in range(256)]
+        for x in a:
+            buckets[((x - lo) >> shift) & 0xFF].append(x)
+        a = [x for bucket in buckets for x in bucket]
+        shift += 8
     return a
 
-@register('heap_sort')
-def heap_sort(arr: List, **kw):
-    a = list(arr)
+@register('heap_sort', pure=True)
+def heap_sort(arr: ArrayLike, **kw):
+    a = _to_list(arr)
     n = len(a)
     def heapify(n, i):
         largest = i
@@ -177,7 +260,294 @@ def heap_sort(arr: List, **kw):
     for i in range(n-1, 0, -1):
         a[0], a[i] = a[i], a[0]
         heapify(i, 0)
-    return a
+    return _like_input(a, arr)
+
+# bincount tables wider than this many slots per element cost more than they save
+_COUNTING_SPAN_FACTOR = 4
+
+@register('counting_sort', pure=True)
+def counting_sort(arr: ArrayLike, **kw):
+    # tally each distinct value, then emit it count times; integers with a compact
+    # range use a bincount table, other values are counted by np.unique
+    a = np.asarray(arr)
+    # a list of tuples comes out 2-D here, and takes the object path like object arrays
+    if a.dtype == object or a.ndim != 1:
+        # Python objects (tuples, mixed types): Counter tallies in C, and runs of equal
+        # keys are emitted without a per-element Python loop
+        vals = _to_list(arr)
+        counts = Counter(vals)
+        return _like_input(list(chain.from_iterable(repeat(v, counts[v]) for v in sorted(counts))), arr)
+    span = int(a.max()) - int(a.min()) + 1 if a.size and a.dtype.kind in 'iu' else 0
+    if a.size == 0:
+        out = a.copy()
+    elif 0 < span <= _COUNTING_SPAN_FACTOR * a.size + 256:
+        # widen before subtracting so narrow dtypes cannot overflow
+        wide = a.astype(np.uint64 if a.dtype.kind == 'u' else np.int64)
+        lo = wide.min()
+        counts = np.bincount((wide - lo).astype(np.intp), minlength=span)
+        out = np.repeat((np.arange(span, dtype=wide.dtype) + lo).astype(a.dtype), counts)
+    else:
+        vals, counts = np.unique(a, return_counts=True)
+        out = np.repeat(vals, counts)
+    return out if isinstance(arr, np.ndarray) else out.tolist()
+
+# NumPy-backed counterparts: same algorithm families executed in C, useful as a
+# reference line next to the interpreter-level implementations above
+@register('np_merge_sort', pure=True)
+def np_merge_sort(arr: ArrayLike, **kw):
+    out = np.sort(np.asarray(arr), kind='stable')
+    return out if isinstance(arr, np.ndarray) else out.tolist()
+
+@register('np_quick_sort', pure=True)
+def np_quick_sort(arr: ArrayLike, **kw):
+    out = np.sort(np.asarray(arr), kind='quicksort')
+    return out if isinstance(arr, np.ndarray) else out.tolist()
+
+@register('np_heap_sort', pure=True)
+def np_heap_sort(arr: ArrayLike, **kw):
+    out = np.sort(np.asarray(arr), kind='heapsort')
+    return out if isinstance(arr, np.ndarray) else out.tolist()
+
+
+# Numba variants: the exact loop bodies above compiled to machine code, so the
+# comparison stays about the algorithm rather than CPython bytecode dispatch
+_QUICK_CUTOFF = 32
+
+if njit is not None:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _insertion_sort_impl(a):
+        for i in range(1, a.shape[0]):
+            key = a[i]
+            j = i - 1
+            while j >= 0 and a[j] > key:
+                a[j + 1] = a[j]
+                j -= 1
+            a[j + 1] = key
+        return a
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _merge_runs_impl(src, dst, lo, mid, hi):
+        i = lo
+        j = mid
+        k = lo
+        while i < mid and j < hi:
+            if src[i] <= src[j]:
+                dst[k] = src[i]
+                i += 1
+            else:
+                dst[k] = src[j]
+                j += 1
+            k += 1
+        while i < mid:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+        while j < hi:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _merge_sort_impl(a):
+        # bottom-up merge_sort with two ping-pong buffers; one scratch array in total
+        n = a.shape[0]
+        src = a
+        dst = np.empty_like(a)
+        swapped = False
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                _merge_runs_impl(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+            src, dst = dst, src
+            swapped = not swapped
+            width *= 2
+        if swapped:
+            a[:] = src
+        return a
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _insertion_sort_range_impl(a, lo, hi):
+        for i in range(lo + 1, hi + 1):
+            key = a[i]
+            j = i - 1
+            while j >= lo and a[j] > key:
+                a[j + 1] = a[j]
+                j -= 1
+            a[j + 1] = key
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _quick_sort_impl(a):
+        # iterative Hoare partition around a median-of-three pivot; ranges of at most
+        # _QUICK_CUTOFF elements are finished by insertion sort
+        n = a.shape[0]
+        # the smaller side is always processed next and the larger one pushed, so at
+        # most log2(n) <= 64 (lo, hi) pairs are ever pending
+        stack = np.empty(128, np.int64)
+        top = 0
+        lo = 0
+        hi = n - 1
+        while True:
+            while hi - lo + 1 > _QUICK_CUTOFF:
+                mid = (lo + hi) // 2
+                # order a[lo] <= a[mid] <= a[hi]; the ends then act as scan sentinels
+                if a[mid] < a[lo]:
+                    a[mid], a[lo] = a[lo], a[mid]
+                if a[hi] < a[lo]:
+                    a[hi], a[lo] = a[lo], a[hi]
+                if a[hi] < a[mid]:
+                    a[hi], a[mid] = a[mid], a[hi]
+                pivot = a[mid]
+                i = lo - 1
+                j = hi + 1
+                while True:
+                    i += 1
+                    while a[i] < pivot:
+                        i += 1
+                    j -= 1
+                    while a[j] > pivot:
+                        j -= 1
+                    if i >= j:
+                        break
+                    a[i], a[j] = a[j], a[i]
+                if j - lo < hi - j:
+                    stack[top] = j + 1
+                    stack[top + 1] = hi
+                    hi = j
+                else:
+                    stack[top] = lo
+                    stack[top + 1] = j
+                    lo = j + 1
+                top += 2
+            _insertion_sort_range_impl(a, lo, hi)
+            if top == 0:
+                break
+            top -= 2
+            lo = stack[top]
+            hi = stack[top + 1]
+        return a
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _comb_sort_impl(a):
+        n = a.shape[0]
+        gap = n
+        shrink = 1.3
+        sorted_flag = False
+        while not sorted_flag:
+            gap = int(gap / shrink)
+            if gap <= 1:
+                gap = 1
+                sorted_flag = True
+            i = 0
+            while i + gap < n:
+                if a[i] > a[i + gap]:
+                    a[i], a[i + gap] = a[i + gap], a[i]
+                    sorted_flag = False
+                i += 1
+        return a
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _radix_sort_impl(keys):
+        # byte-wise LSD radix on unsigned keys; count[] doubles as the 256 bucket
+        # write heads, small enough to stay hot in L1 during the scatter
+        n = keys.shape[0]
+        if n == 0:
+            return keys
+        out = np.empty_like(keys)
+        count = np.zeros(256, np.int64)
+        max_key = keys.max()
+        n_bits = 0
+        while n_bits < 8 * keys.itemsize and (max_key >> n_bits) > 0:
+            n_bits += 8
+        for shift in range(0, n_bits, 8):
+            count[:] = 0
+            for i in range(n):
+                count[(keys[i] >> shift) & 0xFF] += 1
+            if count.max() == n:
+                continue
+            total = 0
+            for b in range(256):
+                c = count[b]
+                count[b] = total
+                total += c
+            for i in range(n):
+                b = (keys[i] >> shift) & 0xFF
+                out[count[b]] = keys[i]
+                count[b] += 1
+            keys, out = out, keys
+        return keys
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _heapify_impl(a, n, i):
+        # iterative form of the recursive heapify in heap_sort
+        while True:
+            largest = i
+            l = 2 * i + 1
+            r = 2 * i + 2
+            if l < n and a[l] > a[largest]:
+                largest = l
+            if r < n and a[r] > a[largest]:
+                largest = r
+            if largest == i:
+                return
+            a[i], a[largest] = a[largest], a[i]
+            i = largest
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _heap_sort_impl(a):
+        n = a.shape[0]
+        for i in range(n // 2 - 1, -1, -1):
+            _heapify_impl(a, n, i)
+        for i in range(n - 1, 0, -1):
+            a[0], a[i] = a[i], a[0]
+            _heapify_impl(a, i, 0)
+        return a
+
+    def _run_impl(impl, arr: ArrayLike):
+        # one private C-contiguous copy: the kernels sort in place on a [::1] buffer
+        a = np.array(arr, order='C')
+        impl(a)
+        return a if isinstance(arr, np.ndarray) else a.tolist()
+
+    @register('insertion_sort_numba', pure=True, nogil=True)
+    def insertion_sort_numba(arr: ArrayLike, **kw):
+        return _run_impl(_insertion_sort_impl, arr)
+
+    @register('merge_sort_numba', pure=True, nogil=True)
+    def merge_sort_numba(arr: ArrayLike, **kw):
+        return _run_impl(_merge_sort_impl, arr)
+
+    @register('quick_sort_numba', pure=True, nogil=True)
+    def quick_sort_numba(arr: ArrayLike, **kw):
+        return _run_impl(_quick_sort_impl, arr)
+
+    @register('comb_sort_numba', pure=True, nogil=True)
+    def comb_sort_numba(arr: ArrayLike, **kw):
+        return _run_impl(_comb_sort_impl, arr)
+
+    @register('radix_sort_numba', pure=True, nogil=True)
+    def radix_sort_numba(arr: ArrayLike, **kw):
+        if not isinstance(arr, np.ndarray) and len(arr) == 0:
+            # an empty list has no integer dtype to take keys from
+            return []
+        a = np.asarray(arr)
+        out = _from_radix_keys(_radix_sort_impl(_to_radix_keys(a)), a.dtype)
+        return out if isinstance(arr, np.ndarray) else out.tolist()
+
+    @register('heap_sort_numba', pure=True, nogil=True)
+    def heap_sort_numba(arr: ArrayLike, **kw):
+        return _run_impl(_heap_sort_impl, arr)
+
+    # Compile the common specializations at import time so no benchmark timing
+    # includes JIT cost; cache=True makes later imports (and workers) load from disk.
+    # Other dtypes (narrowed ints, uint64 codes) are specialized by the benchmark's
+    # warm-up call on the column's real dtype, still outside the timings.
+    for _impl in (_insertion_sort_impl, _merge_sort_impl, _quick_sort_impl,
+                  _comb_sort_impl, _radix_sort_impl, _heap_sort_impl):
+        if _impl is _radix_sort_impl:
+            _impl(np.array([3, 1, 2, 0], dtype=np.uint64))
+        else:
+            _impl(np.array([3, 1, 2, 0], dtype=np.int64))
+            _impl(np.array([3.0, 1.0, 2.0, 0.0], dtype=np.float64))
 
 
 def add_algorithm(name: str, fn: Algorithm):
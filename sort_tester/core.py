@@ -1,80 +1,290 @@
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, Literal, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 import inspect
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from .utils import timeit, is_sorted
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from .utils import timeit, timeit_auto, is_sorted_np
 from .algorithms import builtin_algorithms
 
-def _mean_time_for_alg(alg_path: str, repeat: int, check_sorted: bool, arr: List) -> float:
+BACKENDS = ("auto", "thread", "process")
+
+def _as_column(x, dtype=None) -> np.ndarray:
+    # 1-D view of an algorithm input/output; tuples stay whole elements of an object array
+    if isinstance(x, np.ndarray) and (dtype is None or x.dtype == dtype):
+        return x
+    if dtype is None:
+        a = np.asarray(x)
+        if a.ndim == 1:
+            return a
+        dtype = object
+    if np.dtype(dtype) == object:
+        return np.fromiter(x, dtype=object, count=len(x))
+    return np.asarray(x, dtype=dtype)
+
+_FP_MULT = np.uint64(0x9E3779B97F4A7C15)
+
+def _multiset_fingerprint(a: np.ndarray) -> Tuple[int, int]:
+    """Order-independent O(n) summary of a column's values (sums wrap modulo 2**64)."""
+    if a.dtype.kind in "biufmM" and a.dtype.itemsize in (1, 2, 4, 8):
+        bits = np.ascontiguousarray(a).view(f"u{a.dtype.itemsize}").astype(np.uint64)
+        # a multiply-xorshift mix, so compensating value changes do not cancel in the sum
+        mixed = bits * _FP_MULT
+        mixed ^= mixed >> np.uint64(31)
+        return int(bits.sum()), int(mixed.sum())
+    return len(a), sum(hash(x) for x in a.tolist())
+
+def _same_multiset(got: np.ndarray, ref: np.ndarray) -> bool:
+    """Whether sorted `got` holds the same values as `ref`, with their multiplicities."""
+    if len(ref) == 0:
+        return True
+    if ref.dtype.kind in "iu":
+        lo, hi = ref.min(), ref.max()
+        # got is already known to be sorted, so its ends are its min and max
+        if got[0] < lo or got[-1] > hi:
+            return False
+        # exact for compact spans: one bincount per side over values shifted to 0
+        if int(hi) - int(lo) <= 4 * len(ref) + 256:
+            wide = "u8" if ref.dtype.kind == "u" else "i8"
+            lo = np.asarray(lo).astype(wide)
+            return np.array_equal(np.bincount(got.astype(wide) - lo),
+                                  np.bincount(ref.astype(wide) - lo))
+    if ref.dtype == object:
+        return Counter(got.tolist()) == Counter(ref.tolist())
+    return _multiset_fingerprint(got) == _multiset_fingerprint(ref)
+
+def _is_sorted_output(out, arr) -> bool:
+    # non-decreasing and a permutation of the input: O(n), no reference sort
+    ref = _as_column(arr)
+    try:
+        got = _as_column(out)
+        if got.shape != ref.shape:
+            return False
+        if got.dtype != ref.dtype and not np.can_cast(got.dtype, ref.dtype, "safe"):
+            # a lossy cast (float -> int, int64 -> uint8) could truncate or wrap a wrong
+            # output into a right one: only accept values that survive it unchanged
+            with np.errstate(invalid="ignore", over="ignore"):
+                conv = got.astype(ref.dtype)
+            if not np.array_equal(conv, got):
+                return False
+            got = conv
+        elif got.dtype != ref.dtype:
+            got = got.astype(ref.dtype)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    return is_sorted_np(got) and _same_multiset(got, ref)
+
+# Worker-side attachment to the parent's shared input block (at most one is kept open)
+_attached_shm: Dict[str, shared_memory.SharedMemory] = {}
+
+def _shared_view(shm_name: str, length: int, dtype: str) -> np.ndarray:
+    shm = _attached_shm.get(shm_name)
+    if shm is None:
+        for old in _attached_shm.values():
+            old.close()
+        _attached_shm.clear()
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _attached_shm[shm_name] = shm
+    return np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf)
+
+# alg -> whether it takes its input as the `arr` keyword; inspect.signature is slow
+# enough to show up next to fast algorithms on small samples
+_arr_kw_cache: Dict[Callable, bool] = {}
+
+def _takes_arr_kw(alg: Callable) -> bool:
+    arr_kw = _arr_kw_cache.get(alg)
+    if arr_kw is None:
+        arr_kw = _arr_kw_cache.setdefault(alg, 'arr' in inspect.signature(alg).parameters)
+    return arr_kw
+
+def _call_kwargs(alg: Callable, arr) -> Dict:
+    # extra keyword arguments an algorithm declares via registry attributes; built once
+    # per (algorithm, sample), outside every timed call
+    if getattr(alg, "needs_unique", False):
+        uniq = np.unique(_as_column(arr))
+        return {'unique_list': uniq if isinstance(arr, np.ndarray) else uniq.tolist()}
+    return {}
+
+def _refill(buf, arr):
+    # restore a mutating algorithm's private input in place instead of reallocating it
+    if isinstance(buf, np.ndarray):
+        np.copyto(buf, arr)
+    else:
+        buf[:] = arr
+    return buf
+
+def _input_for(alg: Callable, arr: np.ndarray):
+    # algorithms that have not opted in via `accepts_ndarray` get a plain list
+    return arr if getattr(alg, "accepts_ndarray", False) else arr.tolist()
+
+# (shm_name, length, dtype) of the column published to this worker by _init_worker
+_worker_column: Optional[Tuple[str, int, str]] = None
+
+def _init_worker(shm_name: str, length: int, dtype: str):
+    """Pool initializer: attach the published column once for the worker's lifetime."""
+    global _worker_column
+    _worker_column = (shm_name, length, dtype)
+    _shared_view(shm_name, length, dtype)
+
+def _warm_up(alg: Callable, arr: np.ndarray):
+    # one call on a 4-element slice of the real dtype, so lazy JIT specialization
+    # (numba compiles per dtype) and first-call imports land outside the timings
+    sample = _input_for(alg, arr[:4].copy())
+    try:
+        call_kw = _call_kwargs(alg, sample)
+        if _takes_arr_kw(alg):
+            alg(arr=sample, **call_kw)
+        else:
+            alg(sample, **call_kw)
+    except Exception:
+        # a failing algorithm is reported by the timed run itself
+        pass
+
+# (alg_path, dtype) pairs already warmed up in this worker process
+_warmed_up: set = set()
+
+def _timed_repeats(alg: Callable, arr, arr_kw: bool, mutates: bool, runs: int, call_kw: Dict) -> float:
+    """Mean seconds per call over at least `runs` further calls, without correctness checks."""
+    if not mutates:
+        # the input is never modified, so calls run back-to-back in one timed loop that
+        # grows until it is long enough to dwarf timer resolution and call overhead
+        if arr_kw:
+            mean, _ = timeit_auto(alg, min_calls=runs, arr=arr, **call_kw)
+        else:
+            mean, _ = timeit_auto(alg, arr, min_calls=runs, **call_kw)
+        return float(mean)
+    buf = arr.copy()
+    times: List[float] = []
+    for _ in range(runs):
+        _refill(buf, arr)
+        if arr_kw:
+            elapsed, _ = timeit(alg, arr=buf, **call_kw)
+        else:
+            elapsed, _ = timeit(alg, buf, **call_kw)
+        times.append(elapsed)
+    return float(np.mean(times))
+
+def _mean_time(alg: Callable, repeat: int, check_sorted: bool, arr: np.ndarray) -> float:
+    arr = _input_for(alg, arr)
+    arr_kw = _takes_arr_kw(alg)
+    # unregistered algorithms are assumed to sort in place
+    mutates = getattr(alg, "mutates_input", True)
+    call_kw = _call_kwargs(alg, arr)
+    # first run: checked for correctness, and only timed when it is the sole run
+    first = arr.copy() if mutates else arr
+    if arr_kw:
+        elapsed, out = timeit(alg, arr=first, **call_kw)
+    else:
+        elapsed, out = timeit(alg, first, **call_kw)
+    if check_sorted and not _is_sorted_output(out, arr):
+        return float("nan")
+    runs = max(1, int(repeat)) - 1
+    if runs == 0:
+        return float(elapsed)
+    return _timed_repeats(alg, arr, arr_kw, mutates, runs, call_kw)
+
+def _mean_time_for_alg(alg_path: str, repeat: int, check_sorted: bool, arr: Union[np.ndarray, Tuple[str, int, str], int]) -> float:
     """
     Run a single algorithm multiple times on the given array and return the mean time.
     alg_path: 'module:function' path to import the algorithm to ensure picklability on Windows.
+    arr: the input array, or a (shm_name, length, dtype) descriptor of a shared-memory block
+    holding it, so the data is not pickled into every task. A bare int is a prefix length
+    of the column attached by _init_worker.
     """
     # Import inside the process to avoid pickling function objects on Windows spawn
     module_name, func_name = alg_path.rsplit(":", 1)
     mod = __import__(module_name, fromlist=[func_name])
     alg = getattr(mod, func_name)
-    times: List[float] = []
-    sig = inspect.signature(alg)
-    total_runs = max(1, int(repeat))
-    ref_sorted_first: List = []
-    for i in range(total_runs):
-        arr_copy = list(arr)
-        if 'arr' in sig.parameters:
-            elapsed, out = timeit(alg, arr=arr_copy)
-        else:
-            elapsed, out = timeit(alg, arr_copy)
-        if i == 0 and check_sorted:
-            ref_sorted_first = sorted(arr_copy)
-            if out != ref_sorted_first:
-                return float("nan")
-        times.append(elapsed)
-    return float(np.nanmean(times)) if len(times) > 0 else float("nan")
+    if isinstance(arr, int):
+        shm_name, _, dtype = _worker_column
+        arr = _shared_view(shm_name, arr, dtype)
+    elif isinstance(arr, tuple):
+        arr = _shared_view(*arr)
+    if (alg_path, arr.dtype.str) not in _warmed_up:
+        _warm_up(alg, arr)
+        _warmed_up.add((alg_path, arr.dtype.str))
+    return _mean_time(alg, repeat, check_sorted, arr)
 
 class SortTester:
-    def __init__(self, data: pd.DataFrame, col_name: str, random_seed: int = 0, copy_input: bool = True):
-        if col_name not in data.columns:
-            raise ValueError(f"column '{col_name}' not found in DataFrame")
-        self.data = data.reset_index(drop=True).copy()
+    def __init__(self, data: Union[pd.DataFrame, np.ndarray], col_name: str, random_seed: int = 0, copy_input: bool = True):
         self.col_name = col_name
         self.random_seed = int(random_seed)
         self.copy_input = bool(copy_input)
+        # Typed, contiguous snapshot of the column; every sample is sliced from it so
+        # no dtype re-inference or object boxing happens once benchmarking starts
+        if isinstance(data, np.ndarray):
+            if data.ndim != 1:
+                raise ValueError("data array must be 1-D")
+            self.base_array = np.ascontiguousarray(data)
+            # one-column frame over the same buffer, kept only for plotting metadata
+            self.data = pd.DataFrame({col_name: self.base_array}, copy=False)
+        else:
+            if col_name not in data.columns:
+                raise ValueError(f"column '{col_name}' not found in DataFrame")
+            # only the benchmarked column is kept; the rest of the frame is never read
+            self.data = data[[col_name]].reset_index(drop=True).copy()
+            self.base_array = np.ascontiguousarray(self.data[self.col_name].to_numpy())
         # Precompute a single random permutation for stable prefix sampling across ratios
         rng = np.random.default_rng(self.random_seed)
-        self._perm_indices = rng.permutation(len(self.data)) if len(self.data) > 0 else np.array([], dtype=int)
+        self._perm_indices = rng.permutation(len(self.base_array)) if len(self.base_array) > 0 else np.array([], dtype=int)
+        # (ratio, sequential, prefix_random) -> sample indices, or a slice for sequential prefixes
+        self.samples: Dict[Tuple[float, bool, bool], Union[np.ndarray, slice]] = {}
+
+    def _sample_indices(self, ratio: float, sequential: bool, prefix_random: bool) -> Union[np.ndarray, slice]:
+        # Random samples are always prefixes of the one permutation drawn in __init__, so
+        # they are nested across ratios (a smaller sample is part of every larger one);
+        # prefix_random=False only matters together with sequential=True.
+        seg_len = max(1, int(len(self.base_array) * ratio))
+        if sequential and not prefix_random:
+            return slice(0, seg_len)
+        return self._perm_indices[:seg_len]
+
+    def precompute_samples(self, ratios: List[float], sequential: bool = False, prefix_random: bool = True):
+        """
+        Draw the sample indices for every ratio up front. All algorithms and repeats at a
+        ratio then sort the identical input instance, and no RNG work is left for the
+        benchmark loop.
+        """
+        for r in ratios:
+            if not (0 < r <= 1):
+                raise ValueError("ratio must be in (0, 1]")
+            key = (float(r), bool(sequential), bool(prefix_random))
+            if key not in self.samples:
+                self.samples[key] = self._sample_indices(r, sequential, prefix_random)
 
-    def get_data(self, ratio: float, sequential: bool = False, prefix_random: bool = True) -> List:
+    def get_data(self, ratio: float, sequential: bool = False, prefix_random: bool = True,
+                 as_array: bool = True) -> Union[np.ndarray, List]:
         if not (0 < ratio <= 1):
             raise ValueError("ratio must be in (0, 1]")
-        n = len(self.data)
+        n = len(self.base_array)
         if n == 0:
-            return []
-        if prefix_random:
-            seg_len = max(1, int(n * ratio))
-            idx = self._perm_indices[:seg_len]
-            sampled = self.data.iloc[idx]
-        elif sequential:
-            seg_len = max(1, int(n * ratio))
-            sampled = self.data.iloc[:seg_len]
-        else:
-            sampled = self.data.sample(frac=ratio, random_state=self.random_seed)
-        vals = sampled[self.col_name].tolist()
+            return self.base_array if as_array else []
+        key = (float(ratio), bool(sequential), bool(prefix_random))
+        idx = self.samples.get(key)
+        if idx is None:
+            idx = self._sample_indices(ratio, sequential, prefix_random)
+        vals = self.base_array[idx]
+        if not as_array:
+            return vals.tolist()
         if self.copy_input:
-            vals = list(vals)
+            vals = vals.copy()
         return vals
 
-    def run_single(self, alg: Callable, arr: List, check_sorted: bool = True) -> Dict:
-        arr_copy = list(arr)
-        sig = inspect.signature(alg)
-        if 'arr' in sig.parameters:
-            elapsed, out = timeit(alg, arr=arr_copy)
+    def run_single(self, alg: Callable, arr: np.ndarray, check_sorted: bool = True,
+                   call_kw: Optional[Dict] = None) -> Dict:
+        arr_copy = arr.copy() if getattr(alg, "mutates_input", True) else arr
+        if call_kw is None:
+            call_kw = _call_kwargs(alg, arr)
+        if _takes_arr_kw(alg):
+            elapsed, out = timeit(alg, arr=arr_copy, **call_kw)
         else:
-            elapsed, out = timeit(alg, arr_copy)
+            elapsed, out = timeit(alg, arr_copy, **call_kw)
         correct = True
         if check_sorted:
-            correct = (out == sorted(arr_copy))
+            correct = _is_sorted_output(out, arr)
         return {'time': elapsed, 'correct': bool(correct), 'output': out}
 
     def run_algorithms(
@@ -86,9 +296,23 @@ class SortTester:
         check_sorted: bool = True,
         show_progress: bool = True,
         n_jobs: int = 1,
-        prefix_random: bool = True
+        prefix_random: bool = True,
+        executor: Optional[Executor] = None,
+        backend: Literal["auto", "thread", "process"] = "auto"
     ) -> pd.DataFrame:
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got '{backend}'")
+        if backend == "thread":
+            held = [name for name, alg in alg_dict.items() if not getattr(alg, "nogil", False)]
+            if held:
+                raise ValueError(f"backend='thread' needs nogil algorithms; these hold the GIL: {held}")
         all_ratios = sorted(set(r for r_list in ratios_dict.values() for r in r_list))
+        self.precompute_samples(all_ratios, sequential=sequential, prefix_random=prefix_random)
+        # in-process warm-up (sequential runs and the thread pool); process workers
+        # warm themselves up on their first task
+        if len(self.base_array) > 0:
+            for alg in alg_dict.values():
+                _warm_up(alg, self.base_array)
         results = {name: [] for name in alg_dict.keys()}
         total_steps = len(all_ratios) * max(1, len(alg_dict)) * max(1, int(repeat))
         done_steps = 0
@@ -109,83 +333,139 @@ class SortTester:
                     sys.stderr.flush()
                     last_progress_len = len(msg)
 
-        use_parallel = isinstance(n_jobs, int) and n_jobs > 1
+        # Progress is redrawn at most every 0.5% of the steps or 0.1 s, whichever comes
+        # first: a tqdm update takes a lock and formats a line, which is more than a fast
+        # algorithm's whole run on a small sample.
+        flush_every = max(1, total_steps // 200)
+        pending = 0
+        last_flush = time.perf_counter()
+
+        def _flush():
+            nonlocal done_steps, pending, last_flush, last_progress_len
+            done_steps += pending
+            if pbar is not None:
+                pbar.update(pending)
+            elif use_simple_progress:
+                percent = int(done_steps * 100 / total_steps)
+                msg = f"Progress: {done_steps}/{total_steps} ({percent}%)"
+                padding = " " * max(0, last_progress_len - len(msg))
+                sys.stderr.write("\r" + msg + padding)
+                sys.stderr.flush()
+                last_progress_len = len(msg)
+            pending = 0
+            last_flush = time.perf_counter()
+
+        progress_on = pbar is not None or use_simple_progress
+
+        def _tick(steps: int):
+            nonlocal pending
+            if not progress_on:
+                return
+            pending += steps
+            if pending >= flush_every or time.perf_counter() - last_flush > 0.1:
+                _flush()
+
+        use_parallel = executor is not None or (isinstance(n_jobs, int) and n_jobs > 1)
         if use_parallel:
+            # Kernels flagged `nogil` (numba, compiled with nogil=True) run on threads: they
+            # share `arr` in-process and release the GIL while sorting. Everything else
+            # runs in worker processes, as does everything under backend='process'.
+            thread_names = [] if backend == "process" else [
+                name for name, alg in alg_dict.items() if getattr(alg, "nogil", False)]
+            proc_names = [name for name in alg_dict.keys() if name not in thread_names]
             # Avoid sending function objects across processes; send import path instead
             # Build a mapping name -> "module:function"
             alg_import_paths: Dict[str, str] = {}
-            for name, alg in alg_dict.items():
+            for name in proc_names:
+                alg = alg_dict[name]
                 module_name = getattr(alg, "__module__", None)
                 func_name = getattr(alg, "__name__", None)
                 if not module_name or not func_name:
                     raise ValueError(f"Algorithm '{name}' is not importable in child process")
                 alg_import_paths[name] = f"{module_name}:{func_name}"
 
-            with ProcessPoolExecutor(max_workers=int(n_jobs)) as executor:
+            # Workers map the input from shared memory instead of unpickling a copy per
+            # task. Object arrays cannot be shared.
+            shm = None
+            if proc_names and self.base_array.dtype != object and self.base_array.nbytes > 0:
+                shm = shared_memory.SharedMemory(create=True, size=self.base_array.nbytes)
+            # Every ratio's sample is a prefix of one fixed ordering of the column: publish
+            # that ordering once, and tasks only name a prefix length.
+            if shm is not None:
+                ordered = self.base_array if sequential and not prefix_random else self.base_array[self._perm_indices]
+                np.ndarray(ordered.shape, dtype=ordered.dtype, buffer=shm.buf)[:] = ordered
+            thread_pool = ThreadPoolExecutor(max_workers=max(1, int(n_jobs))) if thread_names else None
+            # a caller-owned executor is reused as-is and left running for the next call
+            proc_pool = None
+            if proc_names:
+                if executor is not None:
+                    proc_pool = executor
+                elif shm is not None:
+                    proc_pool = ProcessPoolExecutor(
+                        max_workers=int(n_jobs), initializer=_init_worker,
+                        initargs=(shm.name, len(self.base_array), self.base_array.dtype.str))
+                else:
+                    proc_pool = ProcessPoolExecutor(max_workers=int(n_jobs))
+            try:
                 for r in all_ratios:
                     arr = self.get_data(r, sequential=sequential, prefix_random=prefix_random)
-                    future_to_name = {}
-                    for name in alg_dict.keys():
-                        fut = executor.submit(_mean_time_for_alg, alg_import_paths[name], int(repeat), bool(check_sorted), arr)
-                        future_to_name[fut] = name
-                    for fut in as_completed(future_to_name):
-                        name = future_to_name[fut]
-                        mean_time = float(fut.result())
-                        results[name].append(mean_time)
-                        if show_progress and total_steps > 0:
-                            # One task covers 'repeat' unit-steps
-                            step_inc = int(repeat)
-                            done_steps += step_inc
-                            if pbar is not None:
-                                pbar.update(step_inc)
-                            elif use_simple_progress:
-                                percent = int(done_steps * 100 / total_steps)
-                                msg = f"Progress: {done_steps}/{total_steps} ({percent}%)"
-                                padding = " " * max(0, last_progress_len - len(msg))
-                                sys.stderr.write("\r" + msg + padding)
-                                sys.stderr.flush()
-                                last_progress_len = len(msg)
+                    payload = arr
+                    if shm is not None:
+                        # a caller-owned pool was not initialized with this run's column
+                        payload = len(arr) if proc_pool is not executor else (shm.name, len(arr), arr.dtype.str)
+                    # drain the thread group before starting the process group so the
+                    # two pools never compete for cores while timing
+                    for pool, names in ((thread_pool, thread_names), (proc_pool, proc_names)):
+                        if pool is None:
+                            continue
+                        future_to_name = {}
+                        for name in names:
+                            if pool is thread_pool:
+                                fut = pool.submit(_mean_time, alg_dict[name], int(repeat), bool(check_sorted), arr)
+                            else:
+                                fut = pool.submit(_mean_time_for_alg, alg_import_paths[name], int(repeat), bool(check_sorted), payload)
+                            future_to_name[fut] = name
+                        for fut in as_completed(future_to_name):
+                            name = future_to_name[fut]
+                            mean_time = float(fut.result())
+                            results[name].append(mean_time)
+                            # one task covers 'repeat' unit-steps
+                            _tick(int(repeat))
+            finally:
+                for pool in (thread_pool, proc_pool):
+                    if pool is not None and pool is not executor:
+                        pool.shutdown()
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
         else:
             for r in all_ratios:
-                arr = self.get_data(r, sequential=sequential, prefix_random=prefix_random)
+                arr_np = self.get_data(r, sequential=sequential, prefix_random=prefix_random)
+                arr_list = None
                 for name, alg in alg_dict.items():
-                    times = []
+                    if getattr(alg, "accepts_ndarray", False):
+                        arr = arr_np
+                    else:
+                        # built once per ratio and shared by every list-only algorithm
+                        if arr_list is None:
+                            arr_list = arr_np.tolist()
+                        arr = arr_list
+                    call_kw = _call_kwargs(alg, arr)
                     # first run: check correctness once
-                    res = self.run_single(alg, arr, check_sorted=check_sorted)
-                    times.append(res['time'] if res['correct'] else np.nan)
-                    if show_progress and total_steps > 0:
-                        done_steps += 1
-                        if pbar is not None:
-                            pbar.update(1)
-                        elif use_simple_progress:
-                            percent = int(done_steps * 100 / total_steps)
-                            msg = f"Progress: {done_steps}/{total_steps} ({percent}%)"
-                            padding = " " * max(0, last_progress_len - len(msg))
-                            sys.stderr.write("\r" + msg + padding)
-                            sys.stderr.flush()
-                            last_progress_len = len(msg)
-                    # remaining runs: no correctness check to avoid O(n) overhead
-                    for _ in range(max(0, int(repeat) - 1)):
-                        arr_copy = list(arr)
-                        sig = inspect.signature(alg)
-                        if 'arr' in sig.parameters:
-                            elapsed, _ = timeit(alg, arr=arr_copy)
-                        else:
-                            elapsed, _ = timeit(alg, arr_copy)
-                        times.append(elapsed)
-                        if show_progress and total_steps > 0:
-                            done_steps += 1
-                            if pbar is not None:
-                                pbar.update(1)
-                            elif use_simple_progress:
-                                percent = int(done_steps * 100 / total_steps)
-                                msg = f"Progress: {done_steps}/{total_steps} ({percent}%)"
-                                padding = " " * max(0, last_progress_len - len(msg))
-                                sys.stderr.write("\r" + msg + padding)
-                                sys.stderr.flush()
-                                last_progress_len = len(msg)
-                    mean_time = float(np.nanmean(times)) if len(times) > 0 else float('nan')
+                    res = self.run_single(alg, arr, check_sorted=check_sorted, call_kw=call_kw)
+                    runs = max(1, int(repeat)) - 1
+                    if not res['correct']:
+                        mean_time = float('nan')
+                    elif runs == 0:
+                        mean_time = float(res['time'])
+                    else:
+                        # remaining runs: no correctness check to avoid O(n) overhead
+                        mean_time = _timed_repeats(alg, arr, _takes_arr_kw(alg),
+                                                   getattr(alg, "mutates_input", True), runs, call_kw)
+                    _tick(1 + runs)
                     results[name].append(mean_time)
+        if pending:
+            _flush()
         if pbar is not None:
             pbar.close()
         elif use_simple_progress:
@@ -196,23 +476,34 @@ class SortTester:
         return df
 
     def complexity_from_df(self, times_df: pd.DataFrame):
-        n_values = (times_df.index.values * len(self.data)).astype(int)
-        out = {}
-        for col in times_df.columns:
-            times = times_df[col].values.astype(float)
-            mask = np.isfinite(times) & (times > 0)
+        n_values = (times_df.index.values * len(self.base_array)).astype(int)
+        times = times_df.to_numpy(dtype=float)
+        valid = np.isfinite(times) & (times > 0)
+        with np.errstate(divide="ignore"):
+            logn_all = np.log(n_values)
+        logt_all = np.log(np.where(valid, times, 1.0))
+        # columns with the same set of usable ratios share one design matrix, so each
+        # group is a single lstsq solve with one right-hand side per algorithm
+        groups: Dict[bytes, List[int]] = {}
+        for j in range(times.shape[1]):
+            groups.setdefault(valid[:, j].tobytes(), []).append(j)
+        fits: Dict[int, Dict] = {}
+        for cols in groups.values():
+            mask = valid[:, cols[0]]
             if mask.sum() < 2:
-                out[col] = {'slope': np.nan, 'r2': np.nan}
+                for j in cols:
+                    fits[j] = {'slope': np.nan, 'r2': np.nan}
                 continue
-            logn = np.log(n_values[mask])
-            logt = np.log(times[mask])
-            slope, intercept = np.polyfit(logn, logt, 1)
-            pred = slope * logn + intercept
-            ss_res = ((logt - pred) ** 2).sum()
-            ss_tot = ((logt - logt.mean()) ** 2).sum()
-            r2 = 1 - ss_res / ss_tot if ss_tot > 0 else np.nan
-            out[col] = {'slope': float(slope), 'r2': float(r2)}
-        return out
+            logn = logn_all[mask]
+            logt = logt_all[np.ix_(mask, cols)]
+            X = np.column_stack([logn, np.ones_like(logn)])
+            coef = np.linalg.lstsq(X, logt, rcond=None)[0]
+            ss_res = ((logt - X @ coef) ** 2).sum(axis=0)
+            ss_tot = ((logt - logt.mean(axis=0)) ** 2).sum(axis=0)
+            for k, j in enumerate(cols):
+                r2 = 1 - ss_res[k] / ss_tot[k] if ss_tot[k] > 0 else np.nan
+                fits[j] = {'slope': float(coef[0, k]), 'r2': float(r2)}
+        return {col: fits[j] for j, col in enumerate(times_df.columns)}
 
     def plot_summary(self, times_df: pd.DataFrame, loglog: bool = True):
         from .plotting import plot_times_df
@@ -12,7 +12,8 @@ def plot_times_df(
     figsize=(8,6),
     save_path: str = None,
     col_name: str = None,
-    title_suffix: Optional[str] = None
+    title_suffix: Optional[str] = None,
+    ax: Optional[plt.Axes] = None
 ) -> Dict[str, Dict[str, float]]:
     if times_df.empty:
         raise ValueError("times_df is empty")
@@ -32,26 +33,39 @@ def plot_times_df(
     ratios = np.asarray(times_df.index.values, dtype=float)
     sort_idx = np.argsort(ratios)
     ratios = ratios[sort_idx]
-    times_df = times_df.iloc[sort_idx]
+    # one float matrix in ratio order; columns are then read by position without
+    # materializing a reordered DataFrame
+    cols = list(times_df.columns)
+    vals = times_df.to_numpy(dtype=float)[sort_idx]
     n_values = np.maximum((ratios * n_total).astype(int), 1)
 
-    plt.figure(figsize=figsize)
+    # draw into the caller's Axes when given (e.g. a grid of columns in one figure);
+    # only a figure created here gets the tight layout engine and is shown
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=figsize)
+        fig.set_layout_engine("tight")
+    else:
+        fig = ax.figure
     complexity_info: Dict[str, Dict[str, float]] = {}
     n_min = max(1, n_values.min())
     n_max = max(n_values.max(), n_min + 1)
     n_ref = np.logspace(np.log10(n_min), np.log10(n_max), 200)
 
     first_n0, first_t0 = None, None
-    for col in times_df.columns:
-        times = times_df[col].values.astype(float)
+    for j in range(len(cols)):
+        times = vals[:, j]
         mask = np.isfinite(times) & (times > 0)
         if mask.sum() > 0:
             first_n0, first_t0 = n_values[mask][0], times[mask][0]
             break
 
     colors = plt.get_cmap('tab10').colors
-    for idx, col in enumerate(times_df.columns):
-        times = times_df[col].values.astype(float)
+    # first pass: the fits; the curves of every fitted column are then evaluated in one
+    # broadcast over the shared log(n_ref) grid
+    fitted_idx, slopes, intercepts = [], [], []
+    for idx, col in enumerate(cols):
+        times = vals[:, idx]
         mask = np.isfinite(times) & (times > 0)
         if mask.sum() < 2:
             complexity_info[col] = {'slope': np.nan, 'r2': np.nan}
@@ -64,32 +78,42 @@ def plot_times_df(
         ss_tot = np.sum((logy - logy.mean()) ** 2)
         r2 = 1.0 - ss_res / ss_tot if ss_tot > 0 else np.nan
         complexity_info[col] = {'slope': float(slope), 'r2': float(r2)}
-        fitted = np.exp(intercept) * (n_ref ** slope)
-        plt.plot(n_ref, fitted, color=colors[idx % 10], linewidth=2.0, label=f"{col} (s={slope:.2f}, R²={r2:.3f})")
+        fitted_idx.append(idx)
+        slopes.append(slope)
+        intercepts.append(intercept)
+
+    if fitted_idx:
+        log_n_ref = np.log(n_ref)
+        fitted = np.exp(np.asarray(intercepts)[:, None] + np.asarray(slopes)[:, None] * log_n_ref[None, :])
+        for row, idx in enumerate(fitted_idx):
+            col = cols[idx]
+            info = complexity_info[col]
+            ax.plot(n_ref, fitted[row], color=colors[idx % 10], linewidth=2.0,
+                    label=f"{col} (s={info['slope']:.2f}, R²={info['r2']:.3f})")
 
     if first_n0 is not None and first_t0 is not None:
         y_n = (first_t0 / first_n0) * n_ref
         y_n2 = (first_t0 / (first_n0 ** 2)) * (n_ref ** 2)
-        plt.fill_between(n_ref, y_n*0.85, y_n*1.15, color='green', alpha=0.15, label='O(n) zone')
-        plt.fill_between(n_ref, y_n2*0.85, y_n2*1.15, color='red', alpha=0.15, label='O(n²) zone')
+        ax.fill_between(n_ref, y_n*0.85, y_n*1.15, color='green', alpha=0.15, label='O(n) zone')
+        ax.fill_between(n_ref, y_n2*0.85, y_n2*1.15, color='red', alpha=0.15, label='O(n²) zone')
 
     if loglog:
-        plt.xscale('log')
-        plt.yscale('log')
+        ax.set_xscale('log')
+        ax.set_yscale('log')
 
-    plt.xlabel("Input size (n)")
-    plt.ylabel("Time (s)")
+    ax.set_xlabel("Input size (n)")
+    ax.set_ylabel("Time (s)")
     base_title = f"Algorithm timings for {col_name}" if col_name else "Algorithm timings (fit vs theory)"
     if title_suffix:
         title_text = f"{base_title} | {title_suffix}"
     else:
         title_text = base_title
-    plt.title(title_text)
-    plt.grid(False)
-    plt.legend(loc='best', frameon=True, framealpha=0.9, edgecolor='black')
-    plt.tight_layout()
+    ax.set_title(title_text)
+    ax.grid(False)
+    ax.legend(loc='best', frameon=True, framealpha=0.9, edgecolor='black')
     if save_path:
-        plt.savefig(save_path, dpi=300)
-    plt.show()
+        fig.savefig(save_path, dpi=300)
+    if own_figure:
+        plt.show()
 
     return complexity_info
@@ -12,7 +12,41 @@ def timeit(func: Callable, *args, **kwargs) -> Tuple[float, any]:
     t1 = time.perf_counter()
     return (t1 - t0, res)
 
+def timeit_auto(func: Callable, *args, min_time_ns: int = 10_000_000, min_calls: int = 1, **kwargs) -> Tuple[float, any]:
+    """
+    Mean seconds per call of func(*args, **kwargs), called back-to-back in batches that
+    double in size until at least min_calls calls and min_time_ns nanoseconds have been
+    timed. Only valid for functions that leave their input untouched.
+    """
+    calls = 0
+    total_ns = 0
+    batch = max(1, int(min_calls))
+    res = None
+    while calls < min_calls or total_ns < min_time_ns:
+        t0 = time.perf_counter_ns()
+        for _ in range(batch):
+            res = func(*args, **kwargs)
+        total_ns += time.perf_counter_ns() - t0
+        calls += batch
+        batch = calls
+    return (total_ns / calls / 1e9, res)
+
+def is_sorted_np(a: np.ndarray) -> bool:
+    # one vectorized compare of neighbours; same `prev > x` test as is_sorted
+    return a.shape[0] < 2 or not bool((a[:-1] > a[1:]).any())
+
 def is_sorted(seq: Iterable) -> bool:
+    if isinstance(seq, np.ndarray) and seq.ndim == 1 and seq.dtype.kind in "iufb":
+        return is_sorted_np(seq)
+    if isinstance(seq, (list, tuple)):
+        # mixed or unbounded values come back as object/str arrays and take the loop below
+        a = np.asarray(seq) if seq and isinstance(seq[0], (int, float)) else None
+        if a is not None and a.ndim == 1 and a.dtype.kind in "iub":
+            return is_sorted_np(a)
+        # ints mixed into floats are rounded to float64; only use the array when every
+        # value survived the conversion exactly (== compares int and float exactly)
+        if a is not None and a.ndim == 1 and a.dtype.kind == "f" and a.tolist() == list(seq):
+            return is_sorted_np(a)
     it = iter(seq)
     try:
         prev = next(it)
@@ -31,3 +65,30 @@ def ensure_list(x):
         return list(x)
     except Exception:
         return [x]
+
+# Packed layout of "code" column keys, high to low bits: p1:16 | p2:8 | p3:24 | p4:16.
+# Each field is an unsigned rank, so comparing the uint64 keys is the same as
+# comparing the (p1, p2, p3, p4) tuples lexicographically.
+CODE_FIELD_BITS = (16, 8, 24, 16)
+
+def pack_code(p1, p2, p3, p4) -> np.ndarray:
+    fields = [np.asarray(p, dtype=np.uint64) for p in (p1, p2, p3, p4)]
+    key = np.zeros(np.broadcast(*fields).shape, dtype=np.uint64)
+    for field, bits in zip(fields, CODE_FIELD_BITS):
+        key = (key << np.uint64(bits)) | field
+    return key
+
+def code_fits(p1, p2, p3, p4) -> np.ndarray:
+    ok = True
+    for p, bits in zip((p1, p2, p3, p4), CODE_FIELD_BITS):
+        p = np.asarray(p)
+        ok = ok & (p >= 0) & (p < (1 << bits))
+    return np.asarray(ok)
+
+def unpack_code(key) -> Tuple:
+    key = np.asarray(key, dtype=np.uint64)
+    out = []
+    for bits in reversed(CODE_FIELD_BITS):
+        out.append(key & np.uint64((1 << bits) - 1))
+        key = key >> np.uint64(bits)
+    return tuple(reversed(out))
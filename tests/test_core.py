@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+
+from sort_tester.core import SortTester, _is_sorted_output
+
+
+class IsSortedOutputTest(unittest.TestCase):
+    def test_accepts_sorted_permutation(self):
+        self.assertTrue(_is_sorted_output(np.array([1, 2, 3]), np.array([3, 1, 2])))
+        self.assertTrue(_is_sorted_output([1, 2], np.array([2, 1], dtype=np.uint8)))
+
+    def test_rejects_float_output_for_int_input(self):
+        # would truncate to [1, 2] under a cast to the input dtype
+        self.assertFalse(_is_sorted_output(np.array([1.9, 2.5]), np.array([2, 1])))
+
+    def test_rejects_values_that_wrap_in_uint8(self):
+        self.assertFalse(_is_sorted_output(np.array([1, 258]), np.array([2, 1], dtype=np.uint8)))
+        self.assertFalse(_is_sorted_output([1, 257], np.array([1, 1], dtype=np.uint8)))
+
+    def test_rejects_overflowing_list(self):
+        self.assertFalse(_is_sorted_output([1, 2 ** 70], np.array([2, 1])))
+
+    def test_benchmark_records_nan_for_overflowing_output(self):
+        def bad_sort(arr, **kw):
+            return [1, 2 ** 70]
+        bad_sort.accepts_ndarray = True
+        tester = SortTester(np.array([2, 1]), "x")
+        df = tester.run_algorithms({"bad": bad_sort}, {"bad": [1.0]}, repeat=1, show_progress=False)
+        self.assertTrue(np.isnan(df["bad"].iloc[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()